@@ -4,6 +4,7 @@ import re
 from collections import OrderedDict
 from typing import List, Dict, Optional
 from tkinter import messagebox
+from profiler import timed
 
 class CommandManager:
     def __init__(self, data_file: str = 'data/commands.json'):
@@ -19,11 +20,13 @@ class CommandManager:
             with open(self.data_file, 'w') as f:
                 json.dump([], f)
     
+    @timed('load')
     def _load_commands(self):
         """加载命令数据"""
         with open(self.data_file, 'r') as f:
             self.commands = json.load(f)
     
+    @timed('save')
     def _save_commands(self):
         """保存命令数据"""
         with open(self.data_file, 'w') as f:
@@ -72,11 +75,11 @@ class CommandManager:
                 return True
         return False
     
+    @timed('search')
     def search_commands(self, query: str, limit: int = 10) -> List[Dict]:
         """搜索命令，按复制次数排序"""
         if not query:
-            # 直接按 copy_count 排序
-            return sorted(self.commands, key=lambda c: c.get('copy_count', 0), reverse=True)[:limit]
+            return self.get_top_commands(limit)
         
         query = query.lower()
         scored_commands = []
@@ -99,6 +102,10 @@ class CommandManager:
         scored_commands.sort(key=lambda x: (x[0], x[1].get('copy_count', 0)), reverse=True)
         return [cmd for score, cmd in scored_commands[:limit]]
     
+    def get_top_commands(self, limit: int = 10) -> List[Dict]:
+        """获取复制次数最多的命令"""
+        return sorted(self.commands, key=lambda c: c.get('copy_count', 0), reverse=True)[:limit]
+
     def get_command_by_id(self, command_id: int) -> Optional[Dict]:
         """根据ID获取命令"""
         for cmd in self.commands:
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Callable, Dict, List
 from command_manager import CommandManager
+import profiler
+from profiler import timed
 
 
 class CommandRetrieverApp:
@@ -16,6 +18,8 @@ class CommandRetrieverApp:
         self.bottom_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
         self._setup_ui()
+        if profiler.ENABLED:
+            self._setup_profile_bar()
 
     def _setup_ui(self):
         """设置用户界面（右侧命令预览）"""
@@ -120,6 +124,28 @@ class CommandRetrieverApp:
         # 初始加载数据
         self._refresh_command_list()
 
+    def _setup_profile_bar(self):
+        """在底部状态栏显示热点路径耗时（仅开启性能统计时）"""
+        self.profile_var = tk.StringVar()
+        self._profile_version = -1
+        ttk.Label(
+            self.bottom_frame,
+            textvariable=self.profile_var,
+            foreground='#666',
+            font=('Consolas', 9),
+            padding=(10, 2)
+        ).pack(side=tk.LEFT)
+        self._update_profile_bar()
+
+    def _update_profile_bar(self):
+        """定时刷新状态栏统计（有新数据时才重新计算）"""
+        version = profiler.get_version()
+        if version != self._profile_version:
+            self._profile_version = version
+            self.profile_var.set(profiler.format_summary())
+        self.root.after(1000, self._update_profile_bar)
+
+    @timed('preview')
     def _update_preview(self, event=None):
         """更新命令预览区（带参数高亮）"""
         cmd = self._get_selected_command()
@@ -147,10 +173,16 @@ class CommandRetrieverApp:
 
     def _refresh_command_list(self, commands: List[Dict] = None):
         """刷新命令列表"""
+        # 默认列表不经过 search_commands，避免计入搜索耗时
+        commands = commands or self.cmd_manager.get_top_commands()
+        self._populate_tree(commands)
+
+    @timed('refresh')
+    def _populate_tree(self, commands: List[Dict]):
+        """重建 Treeview 内容"""
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        commands = commands or self.cmd_manager.search_commands('')
         for cmd in commands:
             self.tree.insert('', tk.END, values=(
                 cmd['id'],
@@ -1,7 +1,16 @@
+import os
+import sys
 import tkinter as tk
+
+# 需在导入 gui 之前设置，计时装饰器在导入时决定是否生效
+if '--profile' in sys.argv:
+    os.environ['NOTE_UTILS_PROFILE'] = '1'
+
+import profiler
 from gui import CommandRetrieverApp
 
 if __name__ == "__main__":
+    profiler.start_session()
     root = tk.Tk()
     app = CommandRetrieverApp(root)
-    root.mainloop()
\ No newline at end of file
+    root.mainloop()
@@ -0,0 +1,178 @@
+import atexit
+import cProfile
+import functools
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# 设置 NOTE_UTILS_PROFILE=1（或启动时加 --profile）开启性能统计
+ENABLED = os.environ.get('NOTE_UTILS_PROFILE', '').lower() not in ('', '0', 'false', 'no')
+OUTPUT_DIR = os.environ.get('NOTE_UTILS_PROFILE_DIR', 'profile')
+WINDOW_SIZE = 200
+MAX_EVENTS = 100000
+
+# 状态栏显示顺序（load 只在启动时执行一次，不在状态栏显示）
+SUMMARY_ORDER = ('search', 'refresh', 'preview', 'save')
+
+# 直方图分桶上限（毫秒），最后一个桶收集所有更慢的调用
+BUCKETS_MS = (0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_samples: Dict[str, deque] = {}
+_counts: Dict[str, int] = {}
+_events: deque = deque(maxlen=MAX_EVENTS)
+_version = 0
+_session_start = time.perf_counter()
+_profiler: Optional[cProfile.Profile] = None
+_session_base: Optional[str] = None
+_dumped = False
+
+logger = logging.getLogger(__name__)
+
+
+def timed(name: str) -> Callable:
+    """计时装饰器，未开启时原样返回函数，不增加任何开销"""
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start, time.perf_counter())
+        return wrapper
+    return decorator
+
+
+def _record(name: str, start: float, end: float):
+    """记录一次调用耗时（滚动窗口 + 追踪事件）"""
+    global _version
+    _version += 1
+    duration_ms = (end - start) * 1000
+    if name not in _samples:
+        _samples[name] = deque(maxlen=WINDOW_SIZE)
+        _counts[name] = 0
+    _samples[name].append(duration_ms)
+    _counts[name] += 1
+    _events.append({
+        'name': name,
+        'ph': 'X',
+        'ts': round((start - _session_start) * 1e6, 1),
+        'dur': round(duration_ms * 1000, 1),
+        'pid': 0,
+        'tid': 0,
+    })
+
+
+def get_version() -> int:
+    """返回记录次数，数据没有变化时该值不变"""
+    return _version
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _histogram(values: List[float]) -> Dict[str, int]:
+    """按 BUCKETS_MS 分桶统计"""
+    hist = {f'<={b}ms': 0 for b in BUCKETS_MS}
+    hist[f'>{BUCKETS_MS[-1]}ms'] = 0
+    for value in values:
+        for bound in BUCKETS_MS:
+            if value <= bound:
+                hist[f'<={bound}ms'] += 1
+                break
+        else:
+            hist[f'>{BUCKETS_MS[-1]}ms'] += 1
+    return hist
+
+
+def get_stats() -> Dict[str, Dict]:
+    """获取各热点路径在滚动窗口内的统计数据"""
+    stats = {}
+    for name, window in _samples.items():
+        values = list(window)
+        if not values:
+            continue
+        stats[name] = {
+            'count': _counts[name],
+            'last_ms': values[-1],
+            'mean_ms': sum(values) / len(values),
+            'p50_ms': _percentile(values, 50),
+            'p95_ms': _percentile(values, 95),
+            'max_ms': max(values),
+            'histogram': _histogram(values),
+        }
+    return stats
+
+
+def _format_ms(value: float) -> str:
+    """格式化耗时，不足 1ms 时以微秒显示"""
+    if value < 1:
+        return f"{value * 1000:.0f}µs"
+    return f"{value:.1f}ms"
+
+
+def format_summary() -> str:
+    """生成状态栏显示的简要统计（p50/p95）"""
+    parts = []
+    for name in SUMMARY_ORDER:
+        values = list(_samples.get(name, ()))
+        if values:
+            parts.append(f"{name} {_format_ms(_percentile(values, 50))}/{_format_ms(_percentile(values, 95))}")
+    if not parts:
+        return "性能统计: 暂无数据"
+    return "p50/p95  " + " | ".join(parts)
+
+
+def _new_session_base() -> str:
+    return os.path.join(OUTPUT_DIR, time.strftime('session-%Y%m%d-%H%M%S'))
+
+
+def start_session():
+    """开启 cProfile 会话，退出时自动导出结果"""
+    global _profiler, _session_base
+    if not ENABLED or _profiler is not None:
+        return
+    _session_base = _new_session_base()
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+    atexit.register(dump_session)
+
+
+def dump_session() -> Optional[str]:
+    """导出 cProfile 数据和 JSON 追踪文件（每个会话只导出一次），返回 JSON 文件路径"""
+    global _profiler, _dumped
+    if not ENABLED or _dumped:
+        return None
+    _dumped = True
+
+    profile = _profiler
+    _profiler = None
+    if profile is not None:
+        profile.disable()
+    base = _session_base or _new_session_base()
+
+    # 窗口模式打包时没有控制台，退出时的异常无人可见，只记录一行日志
+    try:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        if profile is not None:
+            profile.dump_stats(base + '.prof')
+
+        # traceEvents 可直接在 chrome://tracing 或 Perfetto 中打开
+        with open(base + '.json', 'w') as f:
+            json.dump({
+                'stats': get_stats(),
+                'traceEvents': list(_events),
+            }, f, indent=2)
+    except OSError as e:
+        logger.warning("性能统计导出失败: %s", e)
+        return None
+    return base + '.json'